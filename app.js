@@ -2,6 +2,19 @@ const API_BASE = window.location.hostname === 'localhost'
   ? 'http://localhost:5000/api'
   : 'https://biblioteka-backend-4i2b.onrender.com/api';
 
+// Writes answer with X-Primary-Until; sending it back keeps our reads on
+// the primary database until then, so we see our own changes
+async function apiFetch(url, options = {}) {
+  const headers = { ...(options.headers || {}) };
+  const primaryUntil = sessionStorage.getItem('primary_until');
+  if (primaryUntil) headers['X-Primary-Until'] = primaryUntil;
+
+  const res = await fetch(url, { ...options, headers });
+  const newPrimaryUntil = res.headers.get('X-Primary-Until');
+  if (newPrimaryUntil) sessionStorage.setItem('primary_until', newPrimaryUntil);
+  return res;
+}
+
 // SESSION
 function currentUser() {
   const session = sessionStorage.getItem('user_session');
@@ -16,7 +29,7 @@ function logout() {
 // AUTH
 async function registerUser(username, password) {
   try {
-    const res = await fetch(`${API_BASE}/auth/register`, {
+    const res = await apiFetch(`${API_BASE}/auth/register`, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify({ username, password })
@@ -31,7 +44,7 @@ async function registerUser(username, password) {
 
 async function loginUser(username, password) {
   try {
-    const res = await fetch(`${API_BASE}/auth/login`, {
+    const res = await apiFetch(`${API_BASE}/auth/login`, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify({ username, password })
@@ -48,7 +61,7 @@ async function loginUser(username, password) {
 // BOOK CRUD
 async function loadBooks() {
   try {
-    const res = await fetch(`${API_BASE}/books`);
+    const res = await apiFetch(`${API_BASE}/books`);
     const data = await res.json();
     if (!res.ok) return [];
     return data;
@@ -63,7 +76,7 @@ async function searchBooks(query) {
     const url = query
       ? `${API_BASE}/books?search=${encodeURIComponent(query)}`
       : `${API_BASE}/books`;
-    const res = await fetch(url);
+    const res = await apiFetch(url);
     const data = await res.json();
     if (!res.ok) return [];
     return data;
@@ -74,7 +87,7 @@ async function searchBooks(query) {
 }
 
 async function addBook({ title, author, isbn, image }) {
-  const res = await fetch(`${API_BASE}/books`, {
+  const res = await apiFetch(`${API_BASE}/books`, {
     method: 'POST',
     headers: { 'Content-Type': 'application/json' },
     body: JSON.stringify({ title, author, isbn, image })
@@ -85,7 +98,7 @@ async function addBook({ title, author, isbn, image }) {
 }
 
 async function updateBook(id, data) {
-  const res = await fetch(`${API_BASE}/books/${id}`, {
+  const res = await apiFetch(`${API_BASE}/books/${id}`, {
     method: 'PUT',
     headers: { 'Content-Type': 'application/json' },
     body: JSON.stringify(data)
@@ -96,7 +109,7 @@ async function updateBook(id, data) {
 }
 
 async function deleteBook(id) {
-  const res = await fetch(`${API_BASE}/books/${id}`, {
+  const res = await apiFetch(`${API_BASE}/books/${id}`, {
     method: 'DELETE'
   });
   const data = await res.json();
@@ -106,7 +119,7 @@ async function deleteBook(id) {
 
 // BOOK ACTIONS
 async function reserveBook(id, username) {
-  const res = await fetch(`${API_BASE}/books/${id}/reserve`, {
+  const res = await apiFetch(`${API_BASE}/books/${id}/reserve`, {
     method: 'POST',
     headers: { 'Content-Type': 'application/json' },
     body: JSON.stringify({ username })
@@ -117,7 +130,7 @@ async function reserveBook(id, username) {
 }
 
 async function borrowBook(id, username) {
-  const res = await fetch(`${API_BASE}/books/${id}/borrow`, {
+  const res = await apiFetch(`${API_BASE}/books/${id}/borrow`, {
     method: 'POST',
     headers: { 'Content-Type': 'application/json' },
     body: JSON.stringify({ username })
@@ -128,7 +141,7 @@ async function borrowBook(id, username) {
 }
 
 async function returnBook(id, username) {
-  const res = await fetch(`${API_BASE}/books/${id}/return`, {
+  const res = await apiFetch(`${API_BASE}/books/${id}/return`, {
     method: 'POST',
     headers: { 'Content-Type': 'application/json' },
     body: JSON.stringify({ username })
@@ -0,0 +1,105 @@
+"""
+bench_payload.py
+Benchmarks the GET /api/books payload: time to build the JSON response with
+the stdlib and orjson providers, and response size raw / gzip / brotli.
+
+Rows are generated in memory and go through the same book_to_dict() used by
+get_books(), so no database is needed. Run from the repository root:
+
+    python python/bench_payload.py
+    python python/bench_payload.py --sizes 1000 10000 --image-size 4096
+"""
+import argparse
+import gzip
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from flask import Flask  # noqa: E402
+from flask.json.provider import DefaultJSONProvider  # noqa: E402
+from serialization import (  # noqa: E402
+    book_to_dict, OrjsonProvider, orjson, brotli, GZIP_LEVEL, BROTLI_QUALITY
+)
+
+AUTHORS = ['Rainis', 'Aspazija', 'Rūdolfs Blaumanis', 'Anna Brigadere',
+           'Kārlis Skalbe', 'Regīna Ezera', 'Imants Ziedonis']
+STATUSES = ['available', 'reserved', 'borrowed']
+
+
+def make_rows(count, image_size):
+    """Rows shaped like the get_books() SELECT"""
+    rows = []
+    for i in range(count):
+        # Random bytes stand in for JPEG data, which gzip cannot shrink
+        image = os.urandom(image_size) if image_size and i % 4 == 0 else None
+        rows.append((
+            i + 1,
+            f'Grāmata numur {i + 1}',
+            AUTHORS[i % len(AUTHORS)],
+            f'978-9934-{i:06d}',
+            STATUSES[i % len(STATUSES)],
+            image,
+            (i % 50) + 1 if i % 3 else None
+        ))
+    return rows
+
+
+def best_time(func, repeat):
+    """Fastest of `repeat` runs, in milliseconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark /api/books payloads')
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[1000, 10000, 100000])
+    parser.add_argument('--image-size', type=int, default=0,
+                        help='bytes of image data on every 4th book')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    providers = {'stdlib': DefaultJSONProvider(app)}
+    if orjson:
+        providers['orjson'] = OrjsonProvider(app)
+
+    for count in args.sizes:
+        rows = make_rows(count, args.image_size)
+        print(f'\n{count} books')
+
+        books = [book_to_dict(row) for row in rows]
+        build_ms = best_time(
+            lambda: [book_to_dict(row) for row in rows], args.repeat
+        )
+        print(f'  book_to_dict        {build_ms:10.1f} ms')
+
+        for name, provider in providers.items():
+            ms = best_time(lambda: provider.response(books), args.repeat)
+            print(f'  response ({name:6})  {ms:10.1f} ms')
+
+        data = providers['stdlib'].response(books).get_data()
+        print(f'  size raw            {len(data) / 1024:10.1f} KiB')
+
+        start = time.perf_counter()
+        size = len(gzip.compress(data, compresslevel=GZIP_LEVEL))
+        ms = (time.perf_counter() - start) * 1000
+        print(f'  size gzip -{GZIP_LEVEL}        {size / 1024:10.1f} KiB'
+              f'  ({ms:.1f} ms)')
+
+        if brotli:
+            start = time.perf_counter()
+            size = len(brotli.compress(data, quality=BROTLI_QUALITY))
+            ms = (time.perf_counter() - start) * 1000
+            print(f'  size brotli q{BROTLI_QUALITY}     {size / 1024:10.1f} KiB'
+                  f'  ({ms:.1f} ms)')
+
+
+if __name__ == '__main__':
+    main()
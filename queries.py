@@ -0,0 +1,168 @@
+"""
+Bibliotēka Library Management System - SQL query registry
+Every statement used by app.py and python/db_operations.py, by name
+"""
+
+import threading
+import time
+
+QUERIES = {
+    # Schema
+    'create_users_table': '''
+        CREATE TABLE IF NOT EXISTS users (
+            id SERIAL PRIMARY KEY,
+            username TEXT UNIQUE NOT NULL,
+            password TEXT NOT NULL,
+            role TEXT NOT NULL DEFAULT 'user',
+            created_at TIMESTAMP DEFAULT NOW()
+        )
+    ''',
+    'create_books_table': '''
+        CREATE TABLE IF NOT EXISTS books (
+            id SERIAL PRIMARY KEY,
+            title TEXT NOT NULL,
+            author TEXT NOT NULL,
+            isbn TEXT,
+            status TEXT NOT NULL DEFAULT 'available',
+            image BYTEA,
+            reserved_by INTEGER REFERENCES users(id),
+            created_at TIMESTAMP DEFAULT NOW()
+        )
+    ''',
+    'create_loans_table': '''
+        CREATE TABLE IF NOT EXISTS loans (
+            id SERIAL PRIMARY KEY,
+            book_id INTEGER REFERENCES books(id) ON DELETE CASCADE,
+            user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+            borrowed_at TIMESTAMP DEFAULT NOW(),
+            returned_at TIMESTAMP,
+            created_at TIMESTAMP DEFAULT NOW()
+        )
+    ''',
+
+    # Users
+    'insert_user': '''
+        INSERT INTO users (username, password, role)
+        VALUES (%s, %s, %s)
+        RETURNING id, username, role
+    ''',
+    'user_id_by_username': 'SELECT id FROM users WHERE username = %s',
+    'user_role_by_username': 'SELECT id, role FROM users WHERE username = %s',
+    'user_credentials_by_username': '''
+        SELECT id, username, password, role FROM users WHERE username = %s
+    ''',
+
+    # Books
+    'list_books': '''
+        SELECT id, title, author, isbn, status, image, reserved_by
+        FROM books
+        ORDER BY created_at DESC
+    ''',
+    'search_books': '''
+        SELECT id, title, author, isbn, status, image, reserved_by
+        FROM books
+        WHERE LOWER(title) LIKE %s OR LOWER(author) LIKE %s
+        ORDER BY created_at DESC
+    ''',
+    'list_book_summaries': 'SELECT id, title, author, isbn, status FROM books',
+    'insert_book': '''
+        INSERT INTO books (title, author, isbn, status, image)
+        VALUES (%s, %s, %s, %s, %s)
+        RETURNING id, title, author, isbn, status
+    ''',
+    'update_book': '''
+        UPDATE books
+        SET title = %s, author = %s, isbn = %s
+        WHERE id = %s
+        RETURNING id, title, author, isbn, status
+    ''',
+    'update_book_with_image': '''
+        UPDATE books
+        SET title = %s, author = %s, isbn = %s, image = %s
+        WHERE id = %s
+        RETURNING id, title, author, isbn, status
+    ''',
+    'delete_book': 'DELETE FROM books WHERE id = %s',
+    'book_exists': 'SELECT id FROM books WHERE id = %s',
+    'book_status': 'SELECT status FROM books WHERE id = %s',
+    'book_status_and_holder': '''
+        SELECT status, reserved_by FROM books WHERE id = %s
+    ''',
+    'update_book_status': 'UPDATE books SET status = %s WHERE id = %s',
+    'assign_book': '''
+        UPDATE books
+        SET status = %s, reserved_by = %s
+        WHERE id = %s
+    ''',
+    'release_book': '''
+        UPDATE books
+        SET status = %s, reserved_by = NULL
+        WHERE id = %s
+    ''',
+
+    # Loans
+    'insert_loan': '''
+        INSERT INTO loans (book_id, user_id)
+        VALUES (%s, %s)
+    ''',
+    'close_loan': '''
+        UPDATE loans
+        SET returned_at = NOW()
+        WHERE book_id = %s AND user_id = %s AND returned_at IS NULL
+    ''',
+
+    # Replication. NULL (unusable) when the standby is not streaming from the
+    # primary, since replay then looks caught up while falling behind.
+    # pg_stat_wal_receiver.status needs pg_read_all_stats on the app role.
+    'replica_lag': '''
+        SELECT CASE
+            WHEN NOT pg_is_in_recovery() THEN 0
+            WHEN NOT EXISTS (
+                SELECT 1 FROM pg_stat_wal_receiver WHERE status = 'streaming'
+            ) THEN NULL
+            WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+            ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+        END
+    ''',
+}
+
+# Per-query call count, total and slowest execution time in seconds
+stats = {}
+stats_lock = threading.Lock()
+
+
+def run_query(conn, name, params=None, prepare=True):
+    """Execute a named query on a psycopg 3 connection.
+
+    Statements are prepared server-side on first use, once per connection,
+    so pooled connections keep their plans between requests. Schema
+    statements cannot be prepared and must pass prepare=False.
+    """
+    start = time.perf_counter()
+    try:
+        return conn.execute(QUERIES[name], params, prepare=prepare)
+    finally:
+        record(name, time.perf_counter() - start)
+
+
+def record(name, elapsed):
+    """Add one call of `name` taking `elapsed` seconds to the stats"""
+    with stats_lock:
+        entry = stats.setdefault(name, [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += elapsed
+        entry[2] = max(entry[2], elapsed)
+
+
+def query_stats():
+    """Call counts and timings in milliseconds, by query name"""
+    with stats_lock:
+        return {
+            name: {
+                'calls': calls,
+                'total_ms': round(total * 1000, 3),
+                'avg_ms': round(total * 1000 / calls, 3),
+                'max_ms': round(slowest * 1000, 3)
+            }
+            for name, (calls, total, slowest) in stats.items()
+        }
@@ -0,0 +1,76 @@
+"""
+Bibliotēka Library Management System - response serialization
+JSON encoding and compression helpers, importable without a database
+"""
+
+import base64
+import gzip
+import os
+
+from flask.json.provider import DefaultJSONProvider
+
+# Optional faster JSON encoder and brotli compression
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+GZIP_LEVEL = int(os.getenv('GZIP_LEVEL', 6))
+BROTLI_QUALITY = int(os.getenv('BROTLI_QUALITY', 4))
+
+
+def book_to_dict(book):
+    """Convert a books row (id, title, author, isbn, status, image,
+    reserved_by) to its JSON representation"""
+    book_data = {
+        'id': book[0],
+        'title': book[1],
+        'author': book[2],
+        'isbn': book[3],
+        'status': book[4],
+        'image': None,
+        'reserved_by': book[6]
+    }
+
+    if book[5]:
+        book_data['image'] = (
+            'data:image/jpeg;base64,' +
+            base64.b64encode(book[5]).decode('utf-8')
+        )
+
+    return book_data
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson.
+
+    Unlike the stdlib provider, keys keep insertion order instead of being
+    sorted, non-ASCII text is sent as UTF-8 instead of \\u escapes, output
+    is always compact and there is no trailing newline.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response, skipping the
+        # decode/re-encode round trip through str
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default), mimetype=self.mimetype
+        )
+
+
+def compress(data, encoding):
+    """Compress bytes with the given content encoding"""
+    if encoding == 'br':
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=GZIP_LEVEL)